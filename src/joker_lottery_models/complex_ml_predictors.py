@@ -1,7 +1,7 @@
 """Use LSTM to predict the next number in a lottery game."""
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 
 
 import logging
@@ -13,9 +13,12 @@ from tensorflow.keras.layers import LSTM, Dense, Dropout  # pylint: disable=E040
 from statsmodels.tsa.arima.model import ARIMA
 
 from .simple_ml_predictors import MLPredictor
+from .utility import load_params
 
 logger = logging.getLogger(__name__)
 
+ARIMA_DEFAULT_ORDER: Tuple[int, int, int] = (5, 3, 1)
+
 
 @dataclass
 class LSTMPredictor(MLPredictor):
@@ -91,16 +94,27 @@ class LSTMPredictor(MLPredictor):
 class ARIMAPredictor(MLPredictor):
     """Implement ARIMA predictor for the lottery data"""
 
+    params_path: Optional[str] = field(default=None)
+    orders: Dict[str, Tuple[int, int, int]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Post initialization of the ARIMA class"""
+        super().__post_init__()
+        self.orders = {
+            digit: (int(order[0]), int(order[1]), int(order[2]))
+            for digit, order in load_params(self.params_path, "arima").items()
+        }
+
     def prepare_data(self, digit: str = "d1") -> Tuple[Any, Any]:
         """Prepare the data for the ARIMA model"""
         temp = self.data_selection("all")
-        data = temp[digit].values[::-1]
+        data = temp[digit].values[::-1].astype(float)
         return data, []
 
     def train_model(self, digit: str = "d1") -> Any:
         """Train the ARIMA model"""
         data = self.prepare_data(digit)[0]
-        model = ARIMA(data, order=(5, 3, 1))
+        model = ARIMA(data, order=self.orders.get(digit, ARIMA_DEFAULT_ORDER))
         model_fit = model.fit()
         return model_fit
 
@@ -0,0 +1,200 @@
+"""Stream lottery draws from CSV/JSONL/Parquet/Excel files into a compact digit matrix"""
+
+# pylint: disable=W1202,C0209
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import glob
+import logging
+import os
+import numpy as np
+import pandas as pd
+
+from openpyxl import load_workbook
+
+logger = logging.getLogger(__name__)
+
+SCHEMA: List[str] = ["day", "week", "year"] + [f"d{idx}" for idx in range(1, 8)]
+GAME_COLUMN = "game"
+
+BOUNDS: Dict[str, Tuple[int, int]] = {
+    "day": (1, 7),
+    "week": (1, 53),
+    "year": (1900, 2999),
+    **{f"d{idx}": (0, 9) for idx in range(1, 8)},
+}
+
+Reader = Callable[[str, int], Iterator[pd.DataFrame]]
+
+
+def _read_csv(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Read a CSV file in chunks"""
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def _read_jsonl(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Read a JSON lines file in chunks"""
+    with pd.read_json(path, lines=True, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def _read_parquet(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Read a Parquet file in record batches"""
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=C0415
+    except ImportError as err:
+        raise ImportError(
+            "Reading parquet files needs pyarrow. Please install the parquet extra."
+        ) from err
+    parquet_file = pq.ParquetFile(path)
+    names = parquet_file.schema_arrow.names
+    missing = [col for col in SCHEMA if col not in names]
+    if missing:
+        raise ValueError(f"The columns {missing} are missing in {path}")
+    columns = SCHEMA + [GAME_COLUMN] if GAME_COLUMN in names else SCHEMA
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+
+def _read_excel(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Read the first sheet of an Excel file row by row in chunks"""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(val) for val in next(rows, ())]
+        chunk: List[Any] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunksize:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        workbook.close()
+
+
+LOADERS: Dict[str, Reader] = {
+    ".csv": _read_csv,
+    ".jsonl": _read_jsonl,
+    ".ndjson": _read_jsonl,
+    ".parquet": _read_parquet,
+    ".xlsx": _read_excel,
+    ".xlsm": _read_excel,
+}
+
+
+def register_loader(suffix: str, reader: Reader) -> None:
+    """Register a reader which yields data frame chunks for a file suffix"""
+    LOADERS[suffix.lower()] = reader
+
+
+def resolve_paths(path: str) -> List[str]:
+    """Resolve a file, directory or glob pattern to the list of supported files"""
+    if os.path.isdir(path):
+        candidates = [os.path.join(path, name) for name in os.listdir(path)]
+    elif glob.has_magic(path):
+        candidates = glob.glob(path, recursive=True)
+    else:
+        candidates = [path]
+    paths = sorted(
+        val
+        for val in candidates
+        if os.path.isfile(val) and os.path.splitext(val)[1].lower() in LOADERS
+    )
+    if not paths:
+        raise FileNotFoundError(f"No supported data file is found in {path}")
+    return paths
+
+
+def _select_game(
+    chunk: pd.DataFrame, game: Optional[str], games: Set[str]
+) -> pd.DataFrame:
+    """Keep the draws of the selected game if the chunk has a game column and collect the games seen so far"""
+    if GAME_COLUMN not in chunk.columns:
+        return chunk
+    names = chunk[GAME_COLUMN].astype(str)
+    if game is not None:
+        return chunk[names == game]
+    games.update(names.unique().tolist())
+    if len(games) > 1:
+        raise ValueError(
+            f"The data contains the games {sorted(games)}. Please select one of them."
+        )
+    return chunk
+
+
+def _validate_chunk(chunk: pd.DataFrame, path: str) -> Any:
+    """Check the schema of a chunk and convert its valid draws to the compact digit matrix"""
+    missing = [col for col in SCHEMA if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"The columns {missing} are missing in {path}")
+    values = (
+        chunk[SCHEMA]
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=float, na_value=np.nan)
+    )
+    lower = np.array([BOUNDS[col][0] for col in SCHEMA])
+    upper = np.array([BOUNDS[col][1] for col in SCHEMA])
+    with np.errstate(invalid="ignore"):
+        valid = (
+            ~np.isnan(values).any(axis=1)
+            & (values == np.floor(values)).all(axis=1)
+            & (values >= lower).all(axis=1)
+            & (values <= upper).all(axis=1)
+        )
+    if not valid.all():
+        logger.error(
+            "{} invalid draws are skipped in {}".format(int((~valid).sum()), path)
+        )
+    return values[valid].astype(np.int16)
+
+
+def _drop_duplicates(matrix: Any) -> Any:
+    """Drop the repeated draws of a sorted matrix and raise if two draws of the same year/week/day differ"""
+    if len(matrix) < 2:
+        return matrix
+    same = (matrix[1:, :3] == matrix[:-1, :3]).all(axis=1)
+    conflicts = same & (matrix[1:, 3:] != matrix[:-1, 3:]).any(axis=1)
+    if conflicts.any():
+        day, week, year = matrix[1:][conflicts][0, :3].tolist()
+        raise ValueError(
+            f"The files disagree about the draw of year {year}, week {week}, day {day}. "
+            f"Please add a {GAME_COLUMN} column to the files of different games and select one of them."
+        )
+    if same.any():
+        logger.debug("{} repeated draws are dropped".format(int(same.sum())))
+    return matrix[np.concatenate([[True], ~same])]
+
+
+def load_matrix(path: str, chunksize: int = 10000, game: Optional[str] = None) -> Any:
+    """Stream all the draws of a file, directory or glob pattern into one compact digit matrix sorted from
+    the newest draw to the oldest one. Files with a game column hold several games and only the draws of the
+    selected game are kept, files without it are assumed to hold the selected game only.
+    """
+    matrices = []
+    games: Set[str] = set()
+    for file_path in resolve_paths(path):
+        reader = LOADERS[os.path.splitext(file_path)[1].lower()]
+        for chunk in reader(file_path, chunksize):
+            chunk = _select_game(chunk, game, games)
+            matrices.append(_validate_chunk(chunk, file_path))
+        logger.debug("Data is loaded from {}".format(file_path))
+    matrix = (
+        np.concatenate(matrices)
+        if matrices
+        else np.empty((0, len(SCHEMA)), dtype=np.int16)
+    )
+    return _drop_duplicates(
+        matrix[np.lexsort((-matrix[:, 0], -matrix[:, 1], -matrix[:, 2]))]
+    )
+
+
+def load_draws(
+    path: str, chunksize: int = 10000, game: Optional[str] = None
+) -> pd.DataFrame:
+    """Stream all the draws of a file, directory or glob pattern into one data frame sorted from the newest
+    draw to the oldest one"""
+    return pd.DataFrame(load_matrix(path, chunksize, game), columns=SCHEMA).astype(
+        "int64"
+    )
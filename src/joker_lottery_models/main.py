@@ -2,6 +2,7 @@
 
 # pylint: disable=W1202,C0209,R0914,R0801
 import logging
+from typing import Optional
 
 import click
 import pandas as pd
@@ -16,6 +17,7 @@ from joker_lottery_models.markov_analysis import MarkovAnalysis
 from joker_lottery_models.monte_carlo_analysis import MonteCarloAnalysis
 from joker_lottery_models.simple_ml_predictors import RandomForestPredictor
 from joker_lottery_models.complex_ml_predictors import LSTMPredictor, ARIMAPredictor
+from joker_lottery_models.tuning import HyperparameterTuner
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +45,54 @@ logger = logging.getLogger(__name__)
 @click.option(
     "--day", type=int, default=1, help="Set the day for using certain data from history"
 )
-def joker_lottery_models_cli(verbose: int, year: int, week: int, day: int) -> None:
+@click.option(
+    "--data",
+    type=str,
+    default="src/data/data.xlsx",
+    help="Set the data file, directory or glob pattern of CSV/JSONL/Parquet/Excel files",
+)
+@click.option(
+    "--game",
+    type=str,
+    default=None,
+    help="Select the game of the data files which have a game column",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    default=False,
+    help="Store the draws with compact dtypes to reduce the memory usage",
+)
+@click.option(
+    "--params-path",
+    type=str,
+    default="src/data/tuned_params.json",
+    help="Set the json file of the tuned hyperparameters of the predictors",
+)
+@click.option(
+    "--tune",
+    is_flag=True,
+    default=False,
+    help="Search the hyperparameters of the predictors before predicting",
+)
+@click.option(
+    "--jobs",
+    type=int,
+    default=None,
+    help="Set the number of processes for the hyperparameter search",
+)
+def joker_lottery_models_cli(
+    verbose: int,
+    year: int,
+    week: int,
+    day: int,
+    data: str,
+    game: Optional[str],
+    compact: bool,
+    params_path: str,
+    tune: bool,
+    jobs: Optional[int],
+) -> None:
     """Try to analyze the joker data statistically and develop AI models just for fun"""
     if verbose == 1:
         log_level = 10
@@ -58,32 +107,44 @@ def joker_lottery_models_cli(verbose: int, year: int, week: int, day: int) -> No
     results, guess = [], []
     first_digit = 1
 
-    rf_pred = RandomForestPredictor("src/data/data.xlsx")
-    results.append(rf_pred.predict()[0])
+    rf_pred = RandomForestPredictor(
+        data, params_path=params_path, compact=compact, game=game
+    )
+    arima_pred = ARIMAPredictor(
+        data, params_path=params_path, compact=compact, game=game
+    )
+    if tune:
+        tuner = HyperparameterTuner(params_path, jobs)
+        tuner.tune_random_forest(rf_pred)
+        tuner.tune_arima(arima_pred)
 
-    arima_pred = ARIMAPredictor("src/data/data.xlsx")
+    results.append(rf_pred.predict()[0])
     results.append(arima_pred.predict()[0])
 
-    mnt_carlo = MonteCarloAnalysis("src/data/data.xlsx", year, week, day)
+    mnt_carlo = MonteCarloAnalysis(data, year, week, day, compact=compact, game=game)
     for test in ["all", "year", "week", "day"]:
         mnt_res, _ = mnt_carlo.monte_carlo_simulation(test)
         results.append(mnt_res)
 
-    frq_pos = FrequencyAnalysisPosition("src/data/data.xlsx", year - 1, week, day)
+    frq_pos = FrequencyAnalysisPosition(
+        data, year - 1, week, day, compact=compact, game=game
+    )
     for test in ["all", "year", "week", "day"]:
         if test == "day":
             first_digit = frq_pos.frequent_per_year_week_day_digits(test)[0]
         results.append(frq_pos.frequent_per_year_week_day_digits(test))
 
-    mrk = MarkovAnalysis("src/data/data.xlsx", year, week, day)
+    mrk = MarkovAnalysis(data, year, week, day, compact=compact, game=game)
     mrk_year_res, _ = mrk.markov_chain(first_digit, "year")
     results.append(mrk_year_res)
 
-    frq_gen = FrequencyAnalysisGeneral("src/data/data.xlsx", year - 1, week, day)
+    frq_gen = FrequencyAnalysisGeneral(
+        data, year - 1, week, day, compact=compact, game=game
+    )
     for test in ["all", "year", "week", "day"]:
         results.append(frq_gen.frequent_per_year_week_day(test)[0][:7])
 
-    lstm_pred = LSTMPredictor("src/data/data.xlsx", 2025, 1, 1, 7)
+    lstm_pred = LSTMPredictor(data, 2025, 1, 1, 7, compact=compact, game=game)
     results.append(lstm_pred.predict())
 
     result = pd.DataFrame(results, columns=[f"d{idx}" for idx in range(1, 8)])
@@ -25,7 +25,6 @@ class MarkovAnalysis(Dataset):
         """Post initialization of the Markov analysis class"""
         super().__post_init__()
         self.sanity_check()
-        pd.options.mode.copy_on_write = True
 
     def sanity_check(self) -> None:
         """Check if the period of year/week/day are consistent"""
@@ -47,27 +46,13 @@ class MarkovAnalysis(Dataset):
             grouped_data = self.data.groupby("day").get_group(self.day)
         else:
             grouped_data = self.data
-        grouped_data.loc[:, "whole_number"] = grouped_data.apply(
-            lambda x: str(x["d1"])
-            + str(x["d2"])
-            + str(x["d3"])
-            + str(x["d4"])
-            + str(x["d5"])
-            + str(x["d6"])
-            + str(x["d7"]),
-            axis=1,
-        )
         return grouped_data
 
     def _transition_matrix(self, period: str = "year") -> Any:
         """Calculate the transition matrix for the lottery data"""
-        temp = self.data_selection(period)
+        digits = self.data_selection(period)[self.headers[3:]].to_numpy(dtype=np.intp)
         trans_matrix = np.zeros((10, 10))
-        for row in temp.itertuples():
-            for idx in range(len(row.whole_number) - 1):
-                current_digit = int(row.whole_number[idx])
-                next_digit = int(row.whole_number[idx + 1])
-                trans_matrix[current_digit][next_digit] += 1
+        np.add.at(trans_matrix, (digits[:, :-1].ravel(), digits[:, 1:].ravel()), 1)
         return trans_matrix
 
     def _probability_matrix(self, period: str = "year") -> Any:
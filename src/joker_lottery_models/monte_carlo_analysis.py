@@ -25,7 +25,6 @@ class MonteCarloAnalysis(Dataset):
         """Post initialization of the Monte Carlo analysis class"""
         super().__post_init__()
         self.sanity_check()
-        pd.options.mode.copy_on_write = True
 
     def sanity_check(self) -> None:
         """Check if the period of year/week/day are consistent"""
@@ -54,8 +53,9 @@ class MonteCarloAnalysis(Dataset):
     ) -> Tuple[List[int], List[float]]:
         """Implement Monte Carlo simulation for the lottery data"""
         digit_counts = [[0 for _ in range(10)] for _ in range(7)]
+        temp = self.data_selection(period)
         for idx, digit in enumerate(self.headers[3:]):
-            val_cnt = self.data_selection(period)[digit].value_counts()
+            val_cnt = temp[digit].value_counts()
             for i, val in enumerate(val_cnt):
                 digit_counts[idx][val_cnt.index[i]] = val
         digit_probabilities = []
@@ -0,0 +1,215 @@
+"""Index digit co-occurrences and n-grams of the lottery data for fast pattern queries"""
+
+# pylint: disable=W1202,C0209,R0801
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import logging
+import re
+import numpy as np
+import pandas as pd
+
+from .utility import Dataset
+
+logger = logging.getLogger(__name__)
+
+
+def _ngram_code(pattern: str) -> int:
+    """Hash an n-gram of digits to an integer which is unique across n-gram sizes"""
+    return 10 ** len(pattern) + int(pattern)
+
+
+@dataclass
+class PatternAnalysis(Dataset):
+    """Index co-occurrences and n-grams of the digits to answer pattern queries without scanning the history"""
+
+    year: int = field(default=2025)
+    week: int = field(default=1)
+    day: int = field(default=1)
+    ngram_sizes: Tuple[int, ...] = field(default=(1, 2, 3))
+    digits: Any = field(init=False)
+    postings: Dict[int, Any] = field(init=False)
+    _masks: Dict[str, Any] = field(init=False, default_factory=dict)
+    _co_occurrences: Dict[str, Any] = field(init=False, default_factory=dict)
+    _recurring: Dict[Tuple[int, str], Tuple[List[str], List[float]]] = field(
+        init=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        """Post initialization of the pattern analysis class"""
+        super().__post_init__()
+        self.sanity_check()
+        self.digits = self.data[self.headers[3:]].to_numpy(dtype=np.uint8)
+        sizes = tuple(
+            val for val in self.ngram_sizes if 1 <= val <= self.digits.shape[1]
+        )
+        if sizes != tuple(self.ngram_sizes):
+            logger.error(
+                "The n-gram sizes {} are not valid, only {} are indexed.".format(
+                    self.ngram_sizes, sizes
+                )
+            )
+        self.ngram_sizes = sizes
+        self._build_index()
+
+    def sanity_check(self) -> None:
+        """Check if the period of year/week/day are consistent"""
+        if (
+            self.year not in [2025, 2024, 2023, 2022]
+            or self.week > 52
+            or self.day < 1
+            or self.day > 4
+        ):
+            logger.error("The period is not valid. Please check year/week/day values.")
+
+    def data_selection(self, period: str = "year") -> pd.DataFrame:
+        """Select data based on the period of year/week/day"""
+        if period == "year":
+            grouped_data = self.data.groupby("year").get_group(self.year)
+        elif period == "week":
+            grouped_data = self.data.groupby("week").get_group(self.week)
+        elif period == "day":
+            grouped_data = self.data.groupby("day").get_group(self.day)
+        else:
+            grouped_data = self.data
+        return grouped_data
+
+    def _windows(self, size: int) -> Any:
+        """Calculate the n-gram codes of all draws as a (draws, windows) matrix"""
+        digits = self.digits.astype(np.int64)
+        codes = np.full((len(digits), digits.shape[1] - size + 1), 10**size)
+        for idx in range(size):
+            codes += digits[:, idx : idx + codes.shape[1]] * 10 ** (size - 1 - idx)
+        return codes
+
+    def _build_index(self) -> None:
+        """Build the posting list of draw row ids for every n-gram"""
+        self.postings = {}
+        for size in self.ngram_sizes:
+            codes = self._windows(size)
+            rows = np.repeat(np.arange(len(codes)), codes.shape[1])
+            pairs = np.unique(np.stack([codes.ravel(), rows], axis=1), axis=0)
+            keys, starts = np.unique(pairs[:, 0], return_index=True)
+            for key, rows_of_key in zip(keys, np.split(pairs[:, 1], starts[1:])):
+                self.postings[int(key)] = rows_of_key.astype(np.int32)
+        logger.debug("{} n-grams are indexed".format(len(self.postings)))
+
+    def _period_mask(self, period: str = "all") -> Any:
+        """Return a boolean mask of the draws which belong to the period"""
+        if period not in self._masks:
+            mask = np.zeros(len(self.digits), dtype=bool)
+            mask[self.data.index.get_indexer(self.data_selection(period).index)] = True
+            self._masks[period] = mask
+        return self._masks[period]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Report the memory used by the dataset, the digit matrix, the n-gram index and the cached matrices"""
+        report = super().memory_usage()
+        report["digits"] = int(self.digits.nbytes)
+        report["postings"] = sum(int(val.nbytes) for val in self.postings.values())
+        report["co_occurrences"] = sum(
+            int(val.nbytes) for val in self._co_occurrences.values()
+        )
+        report["masks"] = sum(int(val.nbytes) for val in self._masks.values())
+        report["total"] += (
+            report["digits"]
+            + report["postings"]
+            + report["co_occurrences"]
+            + report["masks"]
+        )
+        return report
+
+    def co_occurrence(self, period: str = "all") -> Any:
+        """Calculate the 10x10 matrix counting the draws in which both digits appear, the diagonal counts the
+        draws in which a digit appears at least twice"""
+        if period not in self._co_occurrences:
+            temp = self.digits[self._period_mask(period)]
+            counts = np.zeros((len(temp), 10), dtype=np.int64)
+            np.add.at(counts, (np.arange(len(temp))[:, None], temp), 1)
+            presence = (counts > 0).astype(np.int64)
+            matrix = presence.T @ presence
+            np.fill_diagonal(matrix, (counts > 1).sum(axis=0))
+            self._co_occurrences[period] = matrix
+        return self._co_occurrences[period]
+
+    def pair_frequency(
+        self, first_digit: int, second_digit: int, period: str = "all"
+    ) -> Tuple[int, float]:
+        """Find how often two digits appear together in a draw and its probability"""
+        if not (0 <= first_digit <= 9 and 0 <= second_digit <= 9):
+            logger.error(
+                "The digits {} and {} are not valid.".format(first_digit, second_digit)
+            )
+            return 0, 0.0
+        count = int(self.co_occurrence(period)[first_digit][second_digit])
+        total = int(self._period_mask(period).sum())
+        return count, count / total if total else 0.0
+
+    def pattern_rows(self, pattern: str, period: str = "all") -> Any:
+        """Find the row ids of the draws containing the pattern from the newest to the oldest one"""
+        size = max((val for val in self.ngram_sizes if val <= len(pattern)), default=0)
+        if (
+            not re.fullmatch(r"[0-9]+", pattern)
+            or size == 0
+            or len(pattern) > self.digits.shape[1]
+        ):
+            logger.error("The pattern {} can not be queried.".format(pattern))
+            return np.empty(0, dtype=np.int32)
+        rows = self.postings.get(_ngram_code(pattern[:size]), np.empty(0, np.int32))
+        for idx in range(1, len(pattern) - size + 1):
+            rows = np.intersect1d(
+                rows,
+                self.postings.get(
+                    _ngram_code(pattern[idx : idx + size]), np.empty(0, np.int32)
+                ),
+                assume_unique=True,
+            )
+        if size < len(pattern) and len(rows):
+            windows = self.digits[rows]
+            target = np.array([int(val) for val in pattern])
+            found = np.zeros(len(rows), dtype=bool)
+            for idx in range(self.digits.shape[1] - len(pattern) + 1):
+                found |= (windows[:, idx : idx + len(pattern)] == target).all(axis=1)
+            rows = rows[found]
+        return rows[self._period_mask(period)[rows]]
+
+    def pattern_frequency(self, pattern: str, period: str = "all") -> Tuple[int, float]:
+        """Find the number of draws containing the pattern and its probability"""
+        count = len(self.pattern_rows(pattern, period))
+        total = int(self._period_mask(period).sum())
+        return count, count / total if total else 0.0
+
+    def last_seen(self, pattern: str) -> Optional[Tuple[int, int, int]]:
+        """Find the year/week/day of the latest draw containing the pattern"""
+        rows = self.pattern_rows(pattern)
+        if rows.size == 0:
+            return None
+        latest = self.data.iloc[int(rows[0])]
+        return int(latest["year"]), int(latest["week"]), int(latest["day"])
+
+    def recurring_patterns(
+        self, size: int = 2, period: str = "all", top: int = 10
+    ) -> Tuple[List[str], List[float]]:
+        """Find the most recurring n-grams of a size and the probability of the draws containing them"""
+        if size not in self.ngram_sizes:
+            logger.error("The n-gram size {} is not indexed.".format(size))
+            return [], []
+        if (size, period) not in self._recurring:
+            mask = self._period_mask(period)
+            total = int(mask.sum())
+            counts = {
+                str(key - 10**size).zfill(size): int(mask[rows].sum())
+                for key, rows in self.postings.items()
+                if 10**size <= key < 10 ** (size + 1)
+            }
+            patterns = sorted(counts, key=lambda val: counts[val], reverse=True)
+            self._recurring[(size, period)] = patterns, [
+                counts[val] / total if total else 0.0 for val in patterns
+            ]
+        patterns, probabilities = self._recurring[(size, period)]
+        logger.info(
+            "Most recurring {}-digit patterns in {}: {}".format(
+                size, period, patterns[:top]
+            )
+        )
+        return patterns[:top], probabilities[:top]
@@ -1,7 +1,7 @@
 """Apply random forest classifier to predict the lottery numbers"""
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from abc import ABC, abstractmethod
 
 import logging
@@ -10,10 +10,12 @@ import numpy as np
 
 from sklearn.ensemble import RandomForestClassifier
 
-from .utility import Dataset
+from .utility import Dataset, load_params
 
 logger = logging.getLogger(__name__)
 
+RANDOM_FOREST_DEFAULTS: Dict[str, Any] = {"n_estimators": 1000}
+
 
 @dataclass
 class MLPredictor(ABC, Dataset):
@@ -27,7 +29,6 @@ class MLPredictor(ABC, Dataset):
         """Post initialization of the model class"""
         super().__post_init__()
         self.sanity_check()
-        pd.options.mode.copy_on_write = True
 
     def sanity_check(self) -> None:
         """Check if the period of year/week/day are consistent"""
@@ -49,16 +50,6 @@ class MLPredictor(ABC, Dataset):
             grouped_data = self.data.groupby("day").get_group(self.day)
         else:
             grouped_data = self.data
-        grouped_data.loc[:, "whole_number"] = grouped_data.apply(
-            lambda x: str(x["d1"])
-            + str(x["d2"])
-            + str(x["d3"])
-            + str(x["d4"])
-            + str(x["d5"])
-            + str(x["d6"])
-            + str(x["d7"]),
-            axis=1,
-        )
         return grouped_data
 
     @abstractmethod
@@ -81,7 +72,17 @@ class MLPredictor(ABC, Dataset):
 class RandomForestPredictor(MLPredictor):
     """Implement Random Forest classifier for the lottery data"""
 
+    params_path: Optional[str] = field(default=None)
     model: Any = field(init=False)
+    params: Dict[str, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Post initialization of the Random Forest class"""
+        super().__post_init__()
+        self.params = {
+            **RANDOM_FOREST_DEFAULTS,
+            **load_params(self.params_path, "random_forest"),
+        }
 
     def prepare_data(self) -> Tuple[Any, Any]:
         """Prepare the data for the training purposes"""
@@ -93,7 +94,7 @@ class RandomForestPredictor(MLPredictor):
     def train_model(self) -> None:
         """Train the Random Forest classifier model"""
         x_all, y_all = self.prepare_data()
-        self.model = RandomForestClassifier(n_estimators=1000)
+        self.model = RandomForestClassifier(**self.params)
         self.model.fit(x_all, y_all)
 
     def predict(self) -> Tuple[List[int], List[float]]:
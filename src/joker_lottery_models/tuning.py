@@ -0,0 +1,258 @@
+"""Search the hyperparameters of the ML predictors in parallel and persist the best ones"""
+
+# pylint: disable=W1202,C0209
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import logging
+import math
+import multiprocessing
+import warnings
+import numpy as np
+
+from sklearn.ensemble import RandomForestClassifier
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.stattools import adfuller
+
+from .simple_ml_predictors import RANDOM_FOREST_DEFAULTS
+from .utility import save_params
+
+logger = logging.getLogger(__name__)
+
+_SHARED: Dict[str, Any] = {}
+
+DEFAULT_ARIMA_GRID: List[Tuple[int, int, int]] = list(
+    product(range(6), range(4), range(3))
+)
+DEFAULT_RANDOM_FOREST_GRID: Dict[str, List[Any]] = {
+    "n_estimators": [100, 300, 1000],
+    "max_depth": [None, 5, 10],
+    "min_samples_leaf": [1, 3],
+}
+
+
+def _differencing_order(series: Any, candidates: List[int]) -> int:
+    """Find the smallest differencing order of the candidates which makes the series stationary based on the
+    augmented Dickey-Fuller test"""
+    for diff in sorted(candidates):
+        differenced = np.diff(series, n=diff) if diff else series
+        try:
+            if adfuller(differenced)[1] < 0.05:
+                return diff
+        except (ValueError, np.linalg.LinAlgError):
+            continue
+    return max(candidates)
+
+
+def _init_worker(features: Dict[str, Any], best_scores: Any) -> None:
+    """Keep the shared features and the best scores so far in each worker process"""
+    _SHARED["features"] = features
+    _SHARED["best"] = best_scores
+
+
+def _update_best(slot: int, score: float) -> None:
+    """Update the best score of a slot shared between the workers"""
+    best = _SHARED["best"]
+    with best.get_lock():
+        if score < best[slot]:
+            best[slot] = score
+
+
+def _walk_forward_error(
+    series: Any, order: Tuple[int, int, int], test_size: int, slot: int
+) -> float:
+    """Calculate the one step ahead walk-forward mean absolute error of an ARIMA order and stop as soon as
+    the candidate cannot beat the best score anymore"""
+    total = 0.0
+    for step in range(test_size):
+        split = len(series) - test_size + step
+        forecast = ARIMA(series[:split], order=order).fit().forecast(steps=1)[0]
+        total += abs(float(forecast) - float(series[split]))
+        if total / test_size > _SHARED["best"][slot]:
+            logger.debug("ARIMA order {} is pruned after {} steps".format(order, step))
+            return math.inf
+    return total / test_size
+
+
+def _arima_candidate(
+    digit: str, slot: int, order: Tuple[int, int, int], criterion: str, test_size: int
+) -> Tuple[str, Tuple[int, int, int], float]:
+    """Score an ARIMA order for a digit based on AIC or walk-forward error"""
+    series = _SHARED["features"][digit]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if criterion == "aic":
+                score = float(ARIMA(series, order=order).fit().aic)
+            else:
+                score = _walk_forward_error(series, order, test_size, slot)
+    except (ValueError, np.linalg.LinAlgError):
+        score = math.inf
+    if math.isnan(score):
+        score = math.inf
+    _update_best(slot, score)
+    return digit, order, score
+
+
+def _random_forest_candidate(
+    params: Dict[str, Any], test_size: int, stages: int, tolerance: float
+) -> Tuple[Dict[str, Any], float]:
+    """Score a Random Forest configuration on the latest draws while growing the forest in stages and stop
+    if the error of a stage is far from the best score"""
+    x_all, y_all = _SHARED["features"]["random_forest"]
+    split = len(x_all) - test_size
+    model_params = {**RANDOM_FOREST_DEFAULTS, **params}
+    n_estimators = int(model_params.pop("n_estimators"))
+    error = math.inf
+    try:
+        model = RandomForestClassifier(warm_start=True, **model_params)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for stage in range(1, stages + 1):
+                model.set_params(n_estimators=max(1, n_estimators * stage // stages))
+                model.fit(x_all[:split], y_all[:split])
+                error = 1.0 - float(
+                    np.mean(model.predict(x_all[split:]) == y_all[split:])
+                )
+                if stage < stages and error > _SHARED["best"][0] + tolerance:
+                    logger.debug(
+                        "Random Forest {} is pruned at stage {}".format(params, stage)
+                    )
+                    return params, math.inf
+    except (ValueError, TypeError):
+        logger.debug("Random Forest {} can not be evaluated".format(params))
+        return params, math.inf
+    _update_best(0, error)
+    return params, error
+
+
+@dataclass
+class FeatureCache:
+    """Keep the prepared data of the predictors to avoid regenerating them for each candidate"""
+
+    store: Dict[Tuple[str, str, Optional[str], Tuple[Any, ...]], Tuple[Any, Any]] = (
+        field(default_factory=dict)
+    )
+
+    def get(self, predictor: Any, *args: Any) -> Tuple[Any, Any]:
+        """Return the prepared data of a predictor and prepare it only once"""
+        key = (
+            type(predictor).__name__,
+            predictor.path,
+            getattr(predictor, "game", None),
+            args,
+        )
+        if key not in self.store:
+            self.store[key] = predictor.prepare_data(*args)
+        return self.store[key]
+
+
+@dataclass
+class HyperparameterTuner:
+    """Search the hyperparameters of the ARIMA and Random Forest predictors across a process pool"""
+
+    params_path: str = field(default="src/data/tuned_params.json")
+    n_jobs: Optional[int] = field(default=None)
+    cache: FeatureCache = field(default_factory=FeatureCache)
+
+    def _run(
+        self,
+        func: Callable[..., Any],
+        tasks: List[Tuple[Any, ...]],
+        features: Dict[str, Any],
+        slots: int,
+    ) -> List[Any]:
+        """Run the candidates in a process pool which receives the features only once per worker"""
+        best_scores = multiprocessing.Array("d", [math.inf] * slots)
+        with ProcessPoolExecutor(
+            max_workers=self.n_jobs,
+            initializer=_init_worker,
+            initargs=(features, best_scores),
+        ) as executor:
+            futures = [executor.submit(func, *task) for task in tasks]
+            return [future.result() for future in futures]
+
+    def tune_arima(
+        self,
+        predictor: Any,
+        grid: Optional[List[Tuple[int, int, int]]] = None,
+        criterion: str = "aic",
+        test_size: int = 10,
+    ) -> Dict[str, Tuple[int, int, int]]:
+        """Find the best ARIMA order of each digit based on AIC or walk-forward error. AIC values are only
+        comparable on the same differenced series, so with AIC the differencing order of each digit is fixed by a
+        unit-root test and only the orders with that differencing order are compared. Each AIC candidate needs a
+        single fit, so only the walk-forward candidates are stopped early."""
+        if criterion not in ["aic", "walk_forward"]:
+            logger.error("The criterion is not valid. Please use aic or walk_forward.")
+            return {}
+        grid = grid or DEFAULT_ARIMA_GRID
+        digits = predictor.headers[3:]
+        features = {digit: self.cache.get(predictor, digit)[0] for digit in digits}
+        diffs: Dict[str, int] = {}
+        if criterion == "aic":
+            diffs = {
+                digit: _differencing_order(
+                    features[digit], list({order[1] for order in grid})
+                )
+                for digit in digits
+            }
+            logger.info("Differencing orders for AIC: {}".format(diffs))
+        tasks = [
+            (digit, slot, order, criterion, test_size)
+            for slot, digit in enumerate(digits)
+            for order in grid
+            if criterion != "aic" or order[1] == diffs[digit]
+        ]
+        best: Dict[str, Tuple[Tuple[int, int, int], float]] = {}
+        for digit, order, score in self._run(
+            _arima_candidate, tasks, features, len(digits)
+        ):
+            if score < best.get(digit, ((0, 0, 0), math.inf))[1]:
+                best[digit] = (order, score)
+        if not best:
+            logger.error("No ARIMA order could be evaluated.")
+            return {}
+        orders = {digit: val[0] for digit, val in best.items()}
+        logger.info("Best ARIMA orders with {}: {}".format(criterion, orders))
+        save_params(
+            self.params_path,
+            "arima",
+            {digit: list(order) for digit, order in orders.items()},
+        )
+        predictor.orders = orders
+        return orders
+
+    def tune_random_forest(
+        self,
+        predictor: Any,
+        grid: Optional[Dict[str, List[Any]]] = None,
+        test_size: int = 20,
+        stages: int = 3,
+        tolerance: float = 0.02,
+    ) -> Dict[str, Any]:
+        """Find the best Random Forest parameters based on the error of the latest draws"""
+        grid = grid or DEFAULT_RANDOM_FOREST_GRID
+        features = {"random_forest": self.cache.get(predictor)}
+        tasks = [
+            (dict(zip(grid.keys(), values)), test_size, stages, tolerance)
+            for values in product(*grid.values())
+        ]
+        best_params: Dict[str, Any] = {}
+        best_score = math.inf
+        for params, score in self._run(_random_forest_candidate, tasks, features, 1):
+            if score < best_score:
+                best_params, best_score = params, score
+        if math.isinf(best_score):
+            logger.error("No Random Forest configuration could be evaluated.")
+            return {}
+        logger.info(
+            "Best Random Forest parameters with error {:.3f}: {}".format(
+                best_score, best_params
+            )
+        )
+        save_params(self.params_path, "random_forest", best_params)
+        predictor.params = {**RANDOM_FOREST_DEFAULTS, **best_params}
+        return best_params
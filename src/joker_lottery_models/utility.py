@@ -1,30 +1,118 @@
 """Utility functions/classes for general purposes"""
 
-from typing import List
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 
+import json
+import logging
+import os
+import numpy as np
 import pandas as pd
 
+from .loaders import SCHEMA, load_draws, load_matrix
+
+logger = logging.getLogger(__name__)
+
+COMPACT_DTYPES: Dict[str, Any] = {
+    col: np.uint16 if col == "year" else np.uint8 for col in SCHEMA
+}
+
+
+class DrawMatrix:
+    """Slotted container keeping each column of the draws in its own compact numpy array"""
+
+    __slots__ = ("headers", "arrays")
+
+    def __init__(self, matrix: Any, headers: List[str]) -> None:
+        """Split the digit matrix into compact column arrays"""
+        self.headers = headers
+        self.arrays = {
+            col: np.ascontiguousarray(matrix[:, idx], dtype=COMPACT_DTYPES[col])
+            for idx, col in enumerate(headers)
+        }
+
+    def __len__(self) -> int:
+        """Return the number of draws"""
+        return len(self.arrays[self.headers[0]]) if self.headers else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the column arrays"""
+        return sum(val.nbytes for val in self.arrays.values())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Wrap the column arrays in a data frame without copying them"""
+        return pd.DataFrame(self.arrays, columns=self.headers, copy=False)
+
 
 @dataclass
 class Dataset:
     """Dataset class to load/preprocess data"""
 
     path: str
+    chunksize: int = field(default=10000, kw_only=True)
+    compact: bool = field(default=False, kw_only=True)
+    game: Optional[str] = field(default=None, kw_only=True)
     data: pd.DataFrame = field(init=False)
     headers: List[str] = field(init=False)
     length: int = field(init=False)
+    matrix: Optional[DrawMatrix] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         """Post initialization of the dataset class"""
         self.load_data()
         self.load_headers()
-        self.length = len(self.data)
+        self.length = len(self.matrix) if self.matrix is not None else len(self.data)
 
     def load_data(self) -> pd.DataFrame:
-        """Load the dataset"""
-        self.data = pd.read_excel(self.path)
+        """Load the dataset from a file, directory or glob pattern of CSV/JSONL/Parquet/Excel files"""
+        if self.compact:
+            self.matrix = DrawMatrix(
+                load_matrix(self.path, self.chunksize, self.game), SCHEMA
+            )
+            self.data = self.matrix.to_frame()
+        else:
+            self.data = load_draws(self.path, self.chunksize, self.game)
 
     def load_headers(self) -> None:
         """Load the headers of the dataset"""
         self.headers = self.data.columns.tolist()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Report the memory used by each column of the dataset and in total in bytes"""
+        if self.matrix is not None:
+            report = {col: int(val.nbytes) for col, val in self.matrix.arrays.items()}
+            report["total"] = self.matrix.nbytes
+        else:
+            report = {
+                str(col): int(val)
+                for col, val in self.data.memory_usage(index=True, deep=True).items()
+            }
+            report["total"] = sum(report.values())
+        logger.info(
+            "%s uses %d bytes for %d draws",
+            type(self).__name__,
+            report["total"],
+            self.length,
+        )
+        return report
+
+
+def load_params(path: Optional[str], section: str) -> Dict[str, Any]:
+    """Load the persisted hyperparameters of a predictor from a json file"""
+    if not path or not os.path.isfile(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        params: Dict[str, Any] = json.load(file).get(section, {})
+    return params
+
+
+def save_params(path: str, section: str, params: Dict[str, Any]) -> None:
+    """Persist the hyperparameters of a predictor in a json file without touching the other sections"""
+    content: Dict[str, Any] = {}
+    if os.path.isfile(path):
+        with open(path, "r", encoding="utf-8") as file:
+            content = json.load(file)
+    content[section] = params
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(content, file, indent=4, sort_keys=True)
@@ -0,0 +1,131 @@
+"""Tests for streaming the draws from the data files"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import pytest
+
+from joker_lottery_models.loaders import (
+    LOADERS,
+    load_draws,
+    load_matrix,
+    register_loader,
+)
+from joker_lottery_models.utility import Dataset
+
+HEADER = "day,week,year,d1,d2,d3,d4,d5,d6,d7\n"
+
+
+def _write(path: Path, rows: str) -> str:
+    """Write a small CSV file of draws"""
+    path.write_text(HEADER + rows, encoding="utf-8")
+    return str(path)
+
+
+def test_invalid_draws_are_skipped(tmp_path: Path) -> None:
+    """Unit test for rejecting fractional digits and out of range periods"""
+    path = _write(
+        tmp_path / "draws.csv",
+        "1,2,2025,1,2,3,4,5,6,7\n"
+        "2,2,2025,3.7,2,3,4,5,6,7\n"
+        "300,2,2025,1,2,3,4,5,6,7\n"
+        "1,2,-5,1,2,3,4,5,6,7\n"
+        "1,60,2025,1,2,3,4,5,6,7\n"
+        "1,3,2025,1,2,3,4,5,6,x\n",
+    )
+    data = load_draws(path)
+    assert data.values.tolist() == [[1, 2, 2025, 1, 2, 3, 4, 5, 6, 7]]
+
+
+def test_missing_columns_raise(tmp_path: Path) -> None:
+    """Unit test for a file without the required columns"""
+    path = tmp_path / "draws.csv"
+    path.write_text("day,week,year,d1\n1,2,2025,3\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_draws(str(path))
+
+
+def test_files_are_merged_sorted_and_deduplicated(tmp_path: Path) -> None:
+    """Unit test for merging overlapping CSV and JSONL exports of the same draws"""
+    _write(
+        tmp_path / "old.csv",
+        "1,1,2024,0,0,0,0,0,0,1\n2,1,2024,0,0,0,0,0,0,2\n",
+    )
+    frame = pd.DataFrame(
+        [[2, 1, 2024, 0, 0, 0, 0, 0, 0, 2], [1, 5, 2025, 9, 9, 9, 9, 9, 9, 9]],
+        columns=HEADER.strip().split(","),
+    )
+    frame.to_json(tmp_path / "new.jsonl", orient="records", lines=True)
+    matrix = load_matrix(str(tmp_path), chunksize=1)
+    assert matrix[:, :3].tolist() == [[1, 5, 2025], [2, 1, 2024], [1, 1, 2024]]
+
+
+def test_conflicting_draws_raise(tmp_path: Path) -> None:
+    """Unit test for two files which disagree about the same draw"""
+    _write(tmp_path / "a.csv", "1,1,2024,0,0,0,0,0,0,1\n")
+    _write(tmp_path / "b.csv", "1,1,2024,0,0,0,0,0,0,2\n")
+    with pytest.raises(ValueError):
+        load_matrix(str(tmp_path / "*.csv"))
+
+
+def test_excel_matches_pandas() -> None:
+    """Unit test for streaming the bundled Excel sheet"""
+    dataset = Dataset("src/data/data.xlsx", chunksize=100)
+    assert dataset.data.equals(pd.read_excel("src/data/data.xlsx"))
+
+
+def test_jsonl_only(tmp_path: Path) -> None:
+    """Unit test for streaming a JSON lines file in small chunks"""
+    frame = pd.DataFrame(
+        [[1, 1, 2024, 0, 1, 2, 3, 4, 5, 6], [2, 1, 2024, 6, 5, 4, 3, 2, 1, 0]],
+        columns=HEADER.strip().split(","),
+    )
+    frame.to_json(tmp_path / "draws.jsonl", orient="records", lines=True)
+    data = load_draws(str(tmp_path / "draws.jsonl"), chunksize=1)
+    assert data.values.tolist() == frame.values.tolist()[::-1]
+
+
+def test_register_loader(tmp_path: Path) -> None:
+    """Unit test for reading a new file suffix with a registered reader"""
+
+    def read_tsv(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Read a tab separated file in chunks"""
+        with pd.read_csv(path, sep="\t", chunksize=chunksize) as reader:
+            yield from reader
+
+    path = tmp_path / "draws.tsv"
+    path.write_text(
+        HEADER.replace(",", "\t") + "1\t2\t2025\t1\t2\t3\t4\t5\t6\t7\n",
+        encoding="utf-8",
+    )
+    register_loader(".TSV", read_tsv)
+    try:
+        assert load_draws(str(path)).values.tolist() == [
+            [1, 2, 2025, 1, 2, 3, 4, 5, 6, 7]
+        ]
+    finally:
+        del LOADERS[".tsv"]
+
+
+def test_parquet_missing_columns_raise(tmp_path: Path) -> None:
+    """Unit test for a parquet file without the required columns"""
+    pytest.importorskip("pyarrow")
+    pd.DataFrame({"day": [1], "week": [1], "year": [2025]}).to_parquet(
+        tmp_path / "draws.parquet"
+    )
+    with pytest.raises(ValueError, match="missing"):
+        load_draws(str(tmp_path / "draws.parquet"))
+
+
+def test_games_are_selected(tmp_path: Path) -> None:
+    """Unit test for loading one of several games which share the same dates"""
+    for game, digit in [("joker", 1), ("lotto", 2)]:
+        path = tmp_path / f"{game}.csv"
+        path.write_text(
+            HEADER.strip() + ",game\n" + f"1,1,2025,{digit},0,0,0,0,0,0,{game}\n",
+            encoding="utf-8",
+        )
+    assert load_matrix(str(tmp_path), game="lotto")[:, 3].tolist() == [2]
+    with pytest.raises(ValueError, match="games"):
+        load_matrix(str(tmp_path))
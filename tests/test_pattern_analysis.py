@@ -0,0 +1,90 @@
+"""Tests for the co-occurrence and n-gram index of the draws"""
+
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from joker_lottery_models.pattern_analysis import PatternAnalysis
+
+DRAWS = [
+    (1, 3, 2025, "1231234"),
+    (2, 2, 2025, "9070000"),
+    (1, 2, 2025, "5551235"),
+    (2, 1, 2024, "0123456"),
+    (1, 1, 2024, "9999999"),
+]
+
+
+@pytest.fixture(name="pattern")
+def fixture_pattern(tmp_path: Path) -> PatternAnalysis:
+    """Index a small CSV file of draws from the newest to the oldest one"""
+    path = tmp_path / "draws.csv"
+    lines = ["day,week,year,d1,d2,d3,d4,d5,d6,d7"] + [
+        ",".join([str(day), str(week), str(year), *number])
+        for day, week, year, number in DRAWS
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return PatternAnalysis(str(path), 2025, 1, 1, compact=True)
+
+
+def test_pattern_rows_match_substring_search(pattern: PatternAnalysis) -> None:
+    """Unit test for comparing the n-gram index with a brute-force substring search"""
+    numbers = [val[3] for val in DRAWS]
+    for query in ["1", "12", "123", "1234", "0000", "99", "5551235", "87"]:
+        expected = [idx for idx, val in enumerate(numbers) if query in val]
+        assert pattern.pattern_rows(query).tolist() == expected
+    assert pattern.pattern_rows("12", "year").tolist() == [0, 2]
+
+
+def test_pair_frequency_matches_brute_force(pattern: PatternAnalysis) -> None:
+    """Unit test for the co-occurrence counts of all digit pairs"""
+    numbers = [val[3] for val in DRAWS]
+    for first, second in product("0123456789", repeat=2):
+        if first == second:
+            expected = sum(val.count(first) > 1 for val in numbers)
+        else:
+            expected = sum(first in val and second in val for val in numbers)
+        assert pattern.pair_frequency(int(first), int(second))[0] == expected
+
+
+def test_last_seen_and_recurring(pattern: PatternAnalysis) -> None:
+    """Unit test for the recency and recurring pattern queries"""
+    assert pattern.last_seen("123") == (2025, 3, 1)
+    assert pattern.last_seen("456") == (2024, 1, 2)
+    assert pattern.last_seen("87") is None
+    patterns, probabilities = pattern.recurring_patterns(3, "all", 1)
+    assert patterns == ["123"] and probabilities == [0.6]
+
+
+@pytest.mark.parametrize("query", ["²", "١٢", "1a", "", "12345678"])
+def test_invalid_patterns_are_rejected(pattern: PatternAnalysis, query: str) -> None:
+    """Unit test for patterns which are not ASCII digits of a valid length"""
+    assert pattern.pattern_rows(query).size == 0
+
+
+def test_invalid_digits_and_sizes_are_rejected(tmp_path: Path) -> None:
+    """Unit test for digits outside 0..9 and n-gram sizes longer than a draw"""
+    path = tmp_path / "draws.csv"
+    path.write_text(
+        "day,week,year,d1,d2,d3,d4,d5,d6,d7\n1,1,2025,9,3,0,0,0,0,0\n",
+        encoding="utf-8",
+    )
+    pattern = PatternAnalysis(str(path), ngram_sizes=(2, 8, 0))
+    assert pattern.ngram_sizes == (2,)
+    assert pattern.pair_frequency(9, 3) == (1, 1.0)
+    assert pattern.pair_frequency(-1, 3) == (0, 0.0)
+    assert pattern.pair_frequency(3, 10) == (0, 0.0)
+
+
+def test_memory_usage_counts_the_index(pattern: PatternAnalysis) -> None:
+    """Unit test for reporting the compact digits, the postings and the cached matrices"""
+    pattern.co_occurrence("year")
+    report = pattern.memory_usage()
+    assert pattern.digits.dtype == np.uint8
+    assert all(val.dtype == np.int32 for val in pattern.postings.values())
+    assert report["digits"] == pattern.digits.nbytes
+    assert report["postings"] == sum(val.nbytes for val in pattern.postings.values())
+    assert report["co_occurrences"] == 10 * 10 * 8
+    assert report["total"] == sum(val for key, val in report.items() if key != "total")
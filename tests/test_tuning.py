@@ -0,0 +1,126 @@
+"""Tests for the hyperparameter search of the predictors"""
+
+import json
+import math
+import multiprocessing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import numpy as np
+import pytest
+
+from joker_lottery_models import tuning
+from joker_lottery_models.simple_ml_predictors import RandomForestPredictor
+from joker_lottery_models.utility import load_params, save_params
+
+DATA = "src/data/data.xlsx"
+
+
+@dataclass
+class SeriesPredictor:
+    """Small predictor exposing one series per digit like the ARIMA predictor"""
+
+    path: str = field(default="series")
+    headers: List[str] = field(
+        default_factory=lambda: ["day", "week", "year"]
+        + [f"d{idx}" for idx in range(1, 8)]
+    )
+    calls: int = field(default=0)
+    orders: Any = field(default=None)
+
+    def prepare_data(self, digit: str = "d1") -> Tuple[Any, Any]:
+        """Return a noisy series for a digit"""
+        self.calls += 1
+        rng = np.random.default_rng(int(digit[1:]))
+        return rng.integers(0, 10, 80).astype(float), []
+
+
+def _share(features: Any, best: float) -> None:
+    """Initialize the shared state of a worker in the test process"""
+    tuning._init_worker(  # pylint: disable=W0212
+        features, multiprocessing.Array("d", [best])
+    )
+
+
+def test_params_round_trip(tmp_path: Path) -> None:
+    """Unit test for saving a section without touching the other ones"""
+    path = str(tmp_path / "params.json")
+    assert not load_params(path, "arima")
+    save_params(path, "arima", {"d1": [1, 0, 0]})
+    save_params(path, "random_forest", {"n_estimators": 10})
+    save_params(path, "random_forest", {"max_depth": 3})
+    assert load_params(path, "arima") == {"d1": [1, 0, 0]}
+    assert load_params(path, "random_forest") == {"max_depth": 3}
+    assert not load_params(None, "arima")
+
+
+def test_feature_cache_prepares_once() -> None:
+    """Unit test for preparing the data of a predictor only once"""
+    cache, predictor = tuning.FeatureCache(), SeriesPredictor()
+    first = cache.get(predictor, "d1")
+    assert cache.get(predictor, "d1") is first
+    cache.get(predictor, "d2")
+    assert predictor.calls == 2
+
+
+def test_walk_forward_candidate_is_pruned() -> None:
+    """Unit test for stopping an ARIMA order which can not beat the best error"""
+    _share({"d1": SeriesPredictor().prepare_data("d1")[0]}, 0.0)
+    assert math.isinf(
+        tuning._arima_candidate(  # pylint: disable=W0212
+            "d1", 0, (1, 0, 0), "walk_forward", 5
+        )[2]
+    )
+
+
+def test_random_forest_candidate_is_pruned_or_rejected() -> None:
+    """Unit test for stopping a weak forest and rejecting invalid parameters"""
+    x_all = np.random.default_rng(0).integers(0, 10, (60, 7))
+    _share({"random_forest": (x_all, np.roll(x_all, 1, axis=0))}, 0.0)
+    candidate = tuning._random_forest_candidate  # pylint: disable=W0212
+    assert math.isinf(candidate({"n_estimators": 6}, 10, 3, 0.0)[1])
+    assert math.isinf(candidate({"n_estimators": 6, "max_depth": 0}, 10, 3, 1.0)[1])
+    assert math.isinf(candidate({"n_estimators": 6}, 60, 3, 1.0)[1])
+
+
+def test_tune_arima_with_tiny_grid(tmp_path: Path) -> None:
+    """Unit test for a tiny ARIMA grid with one worker process"""
+    path = str(tmp_path / "params.json")
+    predictor = SeriesPredictor()
+    tuner = tuning.HyperparameterTuner(path, 1)
+    orders = tuner.tune_arima(predictor, [(0, 0, 0), (1, 0, 0)])
+    assert sorted(orders) == predictor.headers[3:]
+    assert predictor.orders == orders
+    assert json.loads(Path(path).read_text(encoding="utf-8"))["arima"]["d1"] in [
+        [0, 0, 0],
+        [1, 0, 0],
+    ]
+
+
+def test_tune_random_forest_is_read_back(tmp_path: Path) -> None:
+    """Unit test for persisting the best forest and loading it in a new predictor"""
+    path = str(tmp_path / "params.json")
+    predictor = RandomForestPredictor(DATA, params_path=path)
+    tuner = tuning.HyperparameterTuner(path, 1)
+    best = tuner.tune_random_forest(
+        predictor, {"max_depth": [0, 3], "random_state": [0]}, stages=2
+    )
+    assert best == {"max_depth": 3, "random_state": 0}
+    assert predictor.params == {"n_estimators": 1000, **best}
+    assert RandomForestPredictor(DATA, params_path=path).params == predictor.params
+
+
+def test_arima_predictor_reads_tuned_orders(tmp_path: Path) -> None:
+    """Unit test for loading the persisted ARIMA orders"""
+    pytest.importorskip("tensorflow")
+    from joker_lottery_models.complex_ml_predictors import (  # pylint: disable=C0415
+        ARIMA_DEFAULT_ORDER,
+        ARIMAPredictor,
+    )
+
+    path = str(tmp_path / "params.json")
+    save_params(path, "arima", {"d1": [1, 0, 0]})
+    predictor = ARIMAPredictor(DATA, params_path=path)
+    assert predictor.orders == {"d1": (1, 0, 0)}
+    assert ARIMAPredictor(DATA).orders.get("d1", ARIMA_DEFAULT_ORDER) == (5, 3, 1)
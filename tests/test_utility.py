@@ -0,0 +1,61 @@
+"""Tests for the compact storage of the dataset"""
+
+import numpy as np
+import pytest
+
+from joker_lottery_models.frequency_analysis import (
+    FrequencyAnalysisGeneral,
+    FrequencyAnalysisPosition,
+)
+from joker_lottery_models.loaders import SCHEMA
+from joker_lottery_models.markov_analysis import MarkovAnalysis
+from joker_lottery_models.utility import COMPACT_DTYPES, Dataset, DrawMatrix
+
+DATA = "src/data/data.xlsx"
+
+
+def test_draw_matrix() -> None:
+    """Unit test for splitting a matrix into compact column arrays"""
+    matrix = DrawMatrix(np.array([[1, 2, 2025] + [9] * 7] * 3), SCHEMA)
+    assert len(matrix) == 3
+    assert matrix.nbytes == 3 * (len(SCHEMA) + 1)
+    assert not hasattr(matrix, "__dict__")
+    frame = matrix.to_frame()
+    assert frame.columns.tolist() == SCHEMA
+    assert all(
+        np.shares_memory(frame[col].to_numpy(), matrix.arrays[col]) for col in SCHEMA
+    )
+
+
+def test_compact_dataset() -> None:
+    """Unit test for the dtypes and the memory report of both storage modes"""
+    compact, default = Dataset(DATA, compact=True), Dataset(DATA)
+    assert compact.matrix is not None and default.matrix is None
+    assert compact.length == default.length == len(compact.matrix)
+    assert compact.data.dtypes.to_dict() == {
+        col: np.dtype(val) for col, val in COMPACT_DTYPES.items()
+    }
+    assert (default.data.dtypes == np.int64).all()
+    assert compact.data.equals(compact.matrix.to_frame())
+    assert (compact.data.to_numpy() == default.data.to_numpy()).all()
+    report = compact.memory_usage()
+    assert (
+        report["total"]
+        == compact.matrix.nbytes
+        == sum(val for key, val in report.items() if key != "total")
+    )
+    assert default.memory_usage()["total"] > 7 * report["total"]
+
+
+@pytest.mark.parametrize("period", ["all", "year", "week", "day"])
+def test_analyzers_match_in_compact_mode(period: str) -> None:
+    """Unit test for getting the same analysis with and without compact storage"""
+    for cls in [MarkovAnalysis, FrequencyAnalysisGeneral, FrequencyAnalysisPosition]:
+        default = cls(DATA, 2024, 1, 1)
+        compact = cls(DATA, 2024, 1, 1, compact=True)
+        if cls is MarkovAnalysis:
+            assert default.markov_chain(3, period) == compact.markov_chain(3, period)
+            continue
+        for method in ["frequent_per_year_week_day", "odd_even_frequency"]:
+            assert getattr(default, method)(period) == getattr(compact, method)(period)
+        assert default.high_low_frequency(period) == compact.high_low_frequency(period)